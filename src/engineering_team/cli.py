@@ -1,27 +1,66 @@
 """Main CLI entry point for engineering-team."""
 
+import importlib
+from typing import List
+
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
+from typer.main import get_command_from_info
+from typer.models import CommandInfo
 
 from . import __version__
-from .commands.init import init_command
-from .commands.list import list_command
-from .commands.status import status_command
-from .commands.sync import sync_command
+
+
+# Subcommand name -> (module, function), in help listing order
+COMMANDS = {
+    "init": ("init", "init_command"),
+    "sync": ("sync", "sync_command"),
+    "list": ("list", "list_command"),
+    "status": ("status", "status_command"),
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Command group that imports a subcommand's module only when it is needed.
+
+    Every name in COMMANDS is always listed, so help output and anything
+    that loads ``app`` directly see the full CLI.
+    """
+
+    def list_commands(self, ctx: typer.Context) -> List[str]:
+        return list(COMMANDS)
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name in COMMANDS and cmd_name not in self.commands:
+            module_name, func_name = COMMANDS[cmd_name]
+            module = importlib.import_module(f".commands.{module_name}", __package__)
+            self.commands[cmd_name] = get_command_from_info(
+                CommandInfo(name=cmd_name, callback=getattr(module, func_name)),
+                pretty_exceptions_short=app.pretty_exceptions_short,
+                rich_markup_mode=self.rich_markup_mode,
+            )
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(self, ctx: typer.Context, args: List[str]):
+        # "Did you mean" suggestions are drawn from the loaded commands
+        if args and args[0] not in COMMANDS:
+            for name in COMMANDS:
+                self.get_command(ctx, name)
+        return super().resolve_command(ctx, args)
 
 
 app = typer.Typer(
     name="engineering-team",
     help="Configure Claude Code agents and skills for your projects.",
     no_args_is_help=True,
+    cls=LazyCommandGroup,
 )
-console = Console()
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console.print(f"engineering-team version {__version__}")
+        typer.echo(f"engineering-team version {__version__}")
         raise typer.Exit()
 
 
@@ -40,11 +79,5 @@ def main(
     pass
 
 
-app.command(name="init")(init_command)
-app.command(name="sync")(sync_command)
-app.command(name="list")(list_command)
-app.command(name="status")(status_command)
-
-
 if __name__ == "__main__":
     app()
@@ -6,25 +6,6 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from ..core.copier import copy_agents, copy_skills
-from ..core.database import (
-    db_exists,
-    get_agents,
-    get_or_create_project,
-    get_project,
-    get_skills,
-    init_database,
-    set_agents,
-    set_skills,
-    update_project_timestamp,
-)
-from ..core.registry import build_registry, resolve_skill_dependencies
-from ..ui.prompts import (
-    confirm_reconfigure,
-    select_agents,
-    select_skills_flat,
-)
-
 
 console = Console()
 
@@ -44,17 +25,45 @@ def init_command(
     ),
 ) -> None:
     """Initialize engineering-team configuration for a project."""
+    # Heavy imports (questionary, pydantic, yaml) are deferred until the
+    # command runs so `--help` and `--version` stay fast.
+    from ..core.copier import copy_agents, copy_skills
+    from ..core.database import (
+        db_exists,
+        db_session,
+        get_installed,
+        get_or_create_project,
+        get_project,
+        init_database,
+        set_agents,
+        set_skills,
+        update_project_timestamp,
+    )
+    from ..core.registry import build_registry, resolve_skill_dependencies
+    from ..ui.prompts import (
+        confirm_reconfigure,
+        select_agents,
+        select_skills_flat,
+    )
+
     if project_dir is None:
         project_dir = Path.cwd()
 
-    # Check for existing database
-    existing_project = None
-    if db_exists(project_dir):
+    # Check for existing database and load its selections as preselected values
+    preselected_agents = None
+    preselected_skills = None
+    db_existed = db_exists(project_dir)
+    if db_existed:
         if not force:
             if not confirm_reconfigure():
                 console.print("[yellow]Aborted.[/yellow]")
                 raise typer.Exit(0)
-        existing_project = get_project(project_dir)
+        with db_session(project_dir) as conn:
+            existing_project = get_project(project_dir, conn=conn)
+            if existing_project:
+                preselected_agents, preselected_skills = get_installed(
+                    existing_project["id"], project_dir, conn=conn
+                )
 
     # Build registry of available agents and skills
     registry = build_registry()
@@ -63,27 +72,18 @@ def init_command(
         console.print("[red]Error: No agents or skills found in the package.[/red]")
         raise typer.Exit(1)
 
-    # Get preselected values from existing config
-    preselected_agents = None
-    preselected_skills = None
-
-    if existing_project:
-        project_id = existing_project["id"]
-        preselected_agents = get_agents(project_id, project_dir)
-        preselected_skills = get_skills(project_id, project_dir)
-
     # 1. Agent selection
     selected_agents = select_agents(registry.agents, preselected_agents)
 
     # 2. Resolve skill dependencies
     required_map = resolve_skill_dependencies(registry, selected_agents)
     if required_map:
-        console.print("\n[bold]Auto-resolved skill dependencies:[/bold]")
+        lines = ["\n[bold]Auto-resolved skill dependencies:[/bold]"]
         for skill, agents in required_map.items():
-            console.print(
+            lines.append(
                 f"  [green]+[/green] {skill} [dim](required by {', '.join(agents)})[/dim]"
             )
-        console.print()
+        console.print("\n".join(lines) + "\n")
 
     # 3. Flat skill selection with required skills pre-checked
     selected_skills = select_skills_flat(registry, required_map, preselected_skills)
@@ -97,32 +97,33 @@ def init_command(
         )
 
     # Initialize database if needed
-    if not db_exists(project_dir):
+    if not db_existed:
         db_path = init_database(project_dir)
         console.print(f"[green]Created {db_path}[/green]")
     else:
         console.print(f"[green]Updated {project_dir / 'engineering-team.db'}[/green]")
 
-    # Get or create project record
-    project_id = get_or_create_project(project_dir)
-
-    # Save selections to database
-    set_agents(project_id, selected_agents, project_dir)
-    set_skills(project_id, selected_skills, project_dir)
-    update_project_timestamp(project_id, project_dir)
+    # Save project record and selections to database in a single transaction
+    with db_session(project_dir) as conn:
+        project_id = get_or_create_project(project_dir, conn=conn)
+        set_agents(project_id, selected_agents, project_dir, conn=conn)
+        set_skills(project_id, selected_skills, project_dir, conn=conn)
+        update_project_timestamp(project_id, project_dir, conn=conn)
 
     # Copy files
     if selected_agents:
         console.print("\n[bold]Installing agents...[/bold]")
-        copied_agents = copy_agents(selected_agents, project_dir)
-        for path in copied_agents:
-            console.print(f"  [green]+[/green] {path.relative_to(project_dir)}")
+        copied_agents = copy_agents(selected_agents, project_dir, registry)
+        console.print("\n".join(
+            f"  [green]+[/green] {path.relative_to(project_dir)}" for path in copied_agents
+        ))
 
     if selected_skills:
         console.print("\n[bold]Installing skills...[/bold]")
-        copied_skills = copy_skills(selected_skills, project_dir)
-        for path in copied_skills:
-            console.print(f"  [green]+[/green] {path.relative_to(project_dir)}")
+        copied_skills = copy_skills(selected_skills, project_dir, registry)
+        console.print("\n".join(
+            f"  [green]+[/green] {path.relative_to(project_dir)}" for path in copied_skills
+        ))
 
     agent_count = len(selected_agents)
     skill_count = len(selected_skills)
@@ -1,13 +1,14 @@
 """List command for engineering-team CLI."""
 
 import json
+import sys
 from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from ..core.registry import build_registry
+from ..ui.format import truncate
 
 
 console = Console()
@@ -34,6 +35,8 @@ def list_command(
     ),
 ) -> None:
     """List available agents and skills."""
+    from ..core.registry import build_registry
+
     registry = build_registry()
 
     if json_output:
@@ -71,7 +74,9 @@ def _output_json(registry, agents_only: bool, skills_only: bool) -> None:
                 for skill in category.skills
             ]
 
-    console.print(json.dumps(data, indent=2))
+    # Stream straight to stdout; Rich would also try to interpret [markup]
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
 def _output_tables(registry, agents_only: bool, skills_only: bool) -> None:
@@ -93,10 +98,7 @@ def _print_agents_table(agents) -> None:
     table.add_column("Model", style="yellow")
 
     for agent in agents:
-        # Truncate description
-        desc = agent.description
-        if len(desc) > 60:
-            desc = desc[:57] + "..."
+        desc = truncate(agent.description, 60)
 
         table.add_row(
             agent.name,
@@ -121,10 +123,7 @@ def _print_skills_tables(categories) -> None:
         table.add_column("Assets", justify="center")
 
         for skill in category.skills:
-            # Truncate description
-            desc = skill.description
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
+            desc = truncate(skill.description, 50)
 
             table.add_row(
                 skill.name,
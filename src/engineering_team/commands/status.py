@@ -7,8 +7,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from ..core.database import db_exists, get_agents, get_project, get_skills
-from ..core.registry import build_registry
+from ..ui.format import truncate
 
 
 console = Console()
@@ -23,6 +22,8 @@ def status_command(
     ),
 ) -> None:
     """Show currently installed agents and skills for a project."""
+    from ..core.database import db_exists, db_session, get_installed, get_project
+
     if project_dir is None:
         project_dir = Path.cwd()
 
@@ -31,47 +32,44 @@ def status_command(
         console.print("Run [cyan]engineering-team init[/cyan] to configure.")
         raise typer.Exit(1)
 
-    project = get_project(project_dir)
+    with db_session(project_dir) as conn:
+        project = get_project(project_dir, conn=conn)
+        if project:
+            agents, skills = get_installed(project["id"], project_dir, conn=conn)
+
     if not project:
         console.print("[red]Error: Could not read project configuration.[/red]")
         raise typer.Exit(1)
 
-    project_id = project["id"]
-    agents = get_agents(project_id, project_dir)
-    skills = get_skills(project_id, project_dir)
-
-    # Get registry for descriptions
-    registry = build_registry()
-
     console.print(f"\n[bold]Project:[/bold] {project_dir.name}")
     console.print(f"[dim]Path: {project_dir}[/dim]\n")
 
     # Agents table
     if agents:
-        _print_agents_table(agents, registry)
+        _print_agents_table(agents)
     else:
         console.print("[dim]No agents installed.[/dim]\n")
 
     # Skills table
     if skills:
-        _print_skills_table(skills, registry)
+        _print_skills_table(skills)
     else:
         console.print("[dim]No skills installed.[/dim]")
 
 
-def _print_agents_table(agent_names: list[str], registry) -> None:
+def _print_agents_table(agent_names: list[str]) -> None:
     """Print installed agents as a table."""
+    from ..core.registry import find_agent
+
     table = Table(title="Installed Agents", show_header=True, header_style="bold cyan")
     table.add_column("Name", style="green")
     table.add_column("Description")
     table.add_column("Model", style="yellow")
 
     for name in sorted(agent_names):
-        agent = registry.get_agent(name)
+        agent = find_agent(name)
         if agent:
-            desc = agent.description
-            if len(desc) > 60:
-                desc = desc[:57] + "..."
+            desc = truncate(agent.description, 60)
             table.add_row(name, desc, agent.model or "-")
         else:
             table.add_row(name, "[dim]Not found in registry[/dim]", "-")
@@ -80,19 +78,19 @@ def _print_agents_table(agent_names: list[str], registry) -> None:
     console.print()
 
 
-def _print_skills_table(skill_names: list[str], registry) -> None:
+def _print_skills_table(skill_names: list[str]) -> None:
     """Print installed skills as a table."""
+    from ..core.registry import find_skill
+
     table = Table(title="Installed Skills", show_header=True, header_style="bold cyan")
     table.add_column("Name", style="green")
     table.add_column("Category", style="magenta")
     table.add_column("Description")
 
     for name in sorted(skill_names):
-        skill = registry.get_skill(name)
+        skill = find_skill(name)
         if skill:
-            desc = skill.description
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
+            desc = truncate(skill.description, 50)
             table.add_row(name, skill.category, desc)
         else:
             table.add_row(name, "-", "[dim]Not found in registry[/dim]")
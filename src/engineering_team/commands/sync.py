@@ -6,15 +6,6 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from ..core.copier import sync_all
-from ..core.database import (
-    db_exists,
-    get_agents,
-    get_or_create_project,
-    get_skills,
-    update_project_timestamp,
-)
-
 
 console = Console()
 
@@ -28,6 +19,15 @@ def sync_command(
     ),
 ) -> None:
     """Sync agents and skills to the latest versions from the CLI package."""
+    from ..core.copier import sync_all
+    from ..core.database import (
+        db_exists,
+        db_session,
+        get_installed,
+        get_or_create_project,
+        update_project_timestamp,
+    )
+
     if project_dir is None:
         project_dir = Path.cwd()
 
@@ -39,34 +39,39 @@ def sync_command(
         )
         raise typer.Exit(1)
 
-    # Get project
-    project_id = get_or_create_project(project_dir)
+    with db_session(project_dir) as conn:
+        # Get project
+        project_id = get_or_create_project(project_dir, conn=conn)
+
+        # Load agents and skills from database
+        agents, skills = get_installed(project_id, project_dir, conn=conn)
+
+        if agents or skills:
+            console.print("[bold]Syncing agents and skills...[/bold]\n")
+
+            # Sync all files
+            copied_agents, copied_skills = sync_all(agents, skills, project_dir)
 
-    # Load agents and skills from database
-    agents = get_agents(project_id, project_dir)
-    skills = get_skills(project_id, project_dir)
+            # Update timestamp
+            update_project_timestamp(project_id, project_dir, conn=conn)
 
     if not agents and not skills:
         console.print("[yellow]No agents or skills configured. Nothing to sync.[/yellow]")
         raise typer.Exit(0)
 
-    console.print("[bold]Syncing agents and skills...[/bold]\n")
-
-    # Sync all files
-    copied_agents, copied_skills = sync_all(agents, skills, project_dir)
-
-    # Report results
+    # Report results in a single write
+    lines = []
     if copied_agents:
-        console.print("[bold]Agents:[/bold]")
-        for path in copied_agents:
-            console.print(f"  [green]~[/green] {path.relative_to(project_dir)}")
+        lines.append("[bold]Agents:[/bold]")
+        lines.extend(
+            f"  [green]~[/green] {path.relative_to(project_dir)}" for path in copied_agents
+        )
 
     if copied_skills:
-        console.print("\n[bold]Skills:[/bold]")
-        for path in copied_skills:
-            console.print(f"  [green]~[/green] {path.relative_to(project_dir)}")
-
-    # Update timestamp
-    update_project_timestamp(project_id, project_dir)
+        lines.append("\n[bold]Skills:[/bold]")
+        lines.extend(
+            f"  [green]~[/green] {path.relative_to(project_dir)}" for path in copied_skills
+        )
 
-    console.print("\n[bold green]Sync complete![/bold green]")
+    lines.append("\n[bold green]Sync complete![/bold green]")
+    console.print("\n".join(lines))
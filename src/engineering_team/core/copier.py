@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Set, Tuple, TypeVar
 
 from .registry import build_registry
-from .schema import AgentInfo, SkillInfo
+from .schema import AgentInfo, Registry, SkillInfo
+
+
+T = TypeVar("T")
 
 
 def get_claude_dir(project_dir: Optional[Path] = None) -> Path:
@@ -29,6 +35,33 @@ def ensure_claude_dirs(project_dir: Optional[Path] = None) -> Tuple[Path, Path]:
     return agents_dir, skills_dir
 
 
+def _is_unchanged(src_stat: os.stat_result, dest: Path) -> bool:
+    """Check whether dest already matches a source file by size, mtime and mode."""
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        return False
+    return (
+        stat.S_ISREG(dest_stat.st_mode)
+        and dest_stat.st_size == src_stat.st_size
+        and dest_stat.st_mtime_ns == src_stat.st_mtime_ns
+        and stat.S_IMODE(dest_stat.st_mode) == stat.S_IMODE(src_stat.st_mode)
+    )
+
+
+def _copy_file(src: str, dest: Path, src_stat: os.stat_result) -> None:
+    """Copy file contents, permission bits and modification time.
+
+    copyfile already uses the platform fast path (sendfile on Linux,
+    fcopyfile on macOS); applying mode and times from the cached stat
+    replaces the extra stat and xattr calls copy2 would make. The
+    preserved mtime is what lets the next sync skip the file.
+    """
+    shutil.copyfile(src, dest)
+    os.chmod(dest, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
 def copy_agent(agent: AgentInfo, project_dir: Optional[Path] = None) -> Path:
     """Copy an agent file to the project's .claude/agents directory."""
     agents_dir, _ = ensure_claude_dirs(project_dir)
@@ -36,72 +69,125 @@ def copy_agent(agent: AgentInfo, project_dir: Optional[Path] = None) -> Path:
     src_path = Path(agent.file_path)
     dest_path = agents_dir / src_path.name
 
-    shutil.copy2(src_path, dest_path)
+    src_stat = src_path.stat()
+    if not _is_unchanged(src_stat, dest_path):
+        _copy_file(agent.file_path, dest_path, src_stat)
     return dest_path
 
 
+def _remove(path: Path) -> None:
+    """Remove a file, symlink, or directory tree."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def _sync_tree(src_dir: Path, dest_dir: Path, names: Optional[Set[str]] = None) -> None:
+    """Mirror src_dir into dest_dir, copying only files that changed.
+
+    If names is given, only those top-level entries are mirrored. Anything
+    in dest_dir that was not mirrored is removed.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    kept = set()
+
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            if names is not None and entry.name not in names:
+                continue
+            kept.add(entry.name)
+            dest = dest_dir / entry.name
+
+            if entry.is_dir():
+                if dest.exists() and not dest.is_dir():
+                    _remove(dest)
+                _sync_tree(Path(entry.path), dest)
+            else:
+                src_stat = entry.stat()
+                if _is_unchanged(src_stat, dest):
+                    continue
+                if dest.is_dir():
+                    _remove(dest)
+                _copy_file(entry.path, dest, src_stat)
+
+    with os.scandir(dest_dir) as entries:
+        for entry in entries:
+            if entry.name not in kept:
+                _remove(Path(entry.path))
+
+
 def copy_skill(skill: SkillInfo, project_dir: Optional[Path] = None) -> Path:
-    """Copy a skill directory to the project's .claude/skills directory."""
+    """Copy a skill directory to the project's .claude/skills directory.
+
+    Files already up to date in the destination are left untouched, and
+    files no longer shipped with the skill are removed.
+    """
     _, skills_dir = ensure_claude_dirs(project_dir)
 
     src_dir = Path(skill.dir_path)
     dest_dir = skills_dir / skill.name
 
-    # Remove existing skill directory if it exists
-    if dest_dir.exists():
-        shutil.rmtree(dest_dir)
-
-    # Copy SKILL.md
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src_dir / "SKILL.md", dest_dir / "SKILL.md")
-
-    # Copy references directory if it exists
+    # SKILL.md plus the optional references/ and assets/ directories
+    names = {"SKILL.md"}
     if skill.has_references:
-        refs_src = src_dir / "references"
-        refs_dest = dest_dir / "references"
-        shutil.copytree(refs_src, refs_dest)
-
-    # Copy assets directory if it exists
+        names.add("references")
     if skill.has_assets:
-        assets_src = src_dir / "assets"
-        assets_dest = dest_dir / "assets"
-        shutil.copytree(assets_src, assets_dest)
+        names.add("assets")
 
+    _sync_tree(src_dir, dest_dir, names)
     return dest_dir
 
 
-def copy_agents(agent_names: List[str], project_dir: Optional[Path] = None) -> List[Path]:
-    """Copy multiple agents to the project."""
-    registry = build_registry()
-    copied = []
-
-    for name in agent_names:
-        agent = registry.get_agent(name)
-        if agent:
-            path = copy_agent(agent, project_dir)
-            copied.append(path)
+def _copy_parallel(
+    copy_fn: Callable[[T, Optional[Path]], Path],
+    items: List[T],
+    project_dir: Optional[Path] = None,
+) -> List[Path]:
+    """Run copy_fn over items on a thread pool, preserving input order."""
+    if len(items) < 2:
+        return [copy_fn(item, project_dir) for item in items]
 
-    return copied
+    # Create the target directories once up front rather than racing in workers
+    ensure_claude_dirs(project_dir)
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(lambda item: copy_fn(item, project_dir), items))
 
 
-def copy_skills(skill_names: List[str], project_dir: Optional[Path] = None) -> List[Path]:
-    """Copy multiple skills to the project."""
-    registry = build_registry()
-    copied = []
+def copy_agents(
+    agent_names: List[str],
+    project_dir: Optional[Path] = None,
+    registry: Optional[Registry] = None,
+) -> List[Path]:
+    """Copy multiple agents to the project."""
+    if registry is None:
+        registry = build_registry()
+    agents = [agent for agent in map(registry.get_agent, agent_names) if agent]
+    return _copy_parallel(copy_agent, agents, project_dir)
 
-    for name in skill_names:
-        skill = registry.get_skill(name)
-        if skill:
-            path = copy_skill(skill, project_dir)
-            copied.append(path)
 
-    return copied
+def copy_skills(
+    skill_names: List[str],
+    project_dir: Optional[Path] = None,
+    registry: Optional[Registry] = None,
+) -> List[Path]:
+    """Copy multiple skills to the project."""
+    if registry is None:
+        registry = build_registry()
+    skills = [skill for skill in map(registry.get_skill, skill_names) if skill]
+    return _copy_parallel(copy_skill, skills, project_dir)
 
 
 def sync_all(
-    agent_names: List[str], skill_names: List[str], project_dir: Optional[Path] = None
+    agent_names: List[str],
+    skill_names: List[str],
+    project_dir: Optional[Path] = None,
+    registry: Optional[Registry] = None,
 ) -> Tuple[List[Path], List[Path]]:
     """Sync all agents and skills to the project (re-copy everything)."""
-    agents = copy_agents(agent_names, project_dir)
-    skills = copy_skills(skill_names, project_dir)
-    return agents, skills
+    if registry is None:
+        registry = build_registry()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        agents = executor.submit(copy_agents, agent_names, project_dir, registry)
+        skills = executor.submit(copy_skills, skill_names, project_dir, registry)
+        return agents.result(), skills.result()
@@ -1,10 +1,13 @@
 """SQLite database handling for engineering-team."""
 
+import atexit
+import os
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Optional
+from typing import Generator, Iterable, List, Optional, Tuple
 
 DB_FILE_NAME = "engineering-team.db"
 CURRENT_SCHEMA_VERSION = 1
@@ -22,71 +25,199 @@ def db_exists(project_dir: Optional[Path] = None) -> bool:
     return get_db_path(project_dir).exists()
 
 
+class _PooledConnection:
+    """A pooled connection and how many get_connection blocks are using it."""
+
+    __slots__ = ("conn", "depth")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.depth = 0
+
+
+# Connections are per thread (sqlite3 objects are not shareable) and per db path
+_pool = threading.local()
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """Open and configure a new database connection."""
+    # sqlite3's default 5s timeout already acts as the busy timeout
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    # WAL avoids rewriting the main file on every commit; NORMAL sync is
+    # durable enough for a local config store and skips most fsyncs.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+def _pooled_connection(project_dir: Optional[Path] = None) -> _PooledConnection:
+    """Get this thread's pooled connection for a project, opening it if needed."""
+    if _pool.__dict__.get("pid") != os.getpid():
+        # SQLite handles must not cross a fork: a child process starts with
+        # an empty pool rather than reusing (or closing) its parent's
+        _pool.connections = {}
+        _pool.pid = os.getpid()
+    connections = _pool.connections
+    db_path = os.path.abspath(get_db_path(project_dir))
+
+    pooled = connections.get(db_path)
+    if pooled is None:
+        pooled = _PooledConnection(_open_connection(db_path))
+        connections[db_path] = pooled
+    return pooled
+
+
+def close_connections() -> None:
+    """Close this thread's pooled connections.
+
+    Registered with atexit; also useful when a database file is about to be
+    removed or replaced.
+    """
+    if _pool.__dict__.get("pid") != os.getpid():
+        # Inherited across a fork; the parent still owns these handles
+        _pool.__dict__.pop("connections", None)
+        return
+    connections = _pool.__dict__.get("connections", {})
+    for pooled in connections.values():
+        try:
+            # Refreshes planner statistics only when SQLite judges them stale;
+            # the UNIQUE(project_id, ...) indexes already cover every lookup.
+            # analysis_limit bounds the work if a table has grown large.
+            pooled.conn.execute("PRAGMA analysis_limit=400")
+            pooled.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        pooled.conn.close()
+    connections.clear()
+
+
+atexit.register(close_connections)
+
+
 @contextmanager
 def get_connection(project_dir: Optional[Path] = None) -> Generator[sqlite3.Connection, None, None]:
-    """Context manager for database connections."""
-    db_path = get_db_path(project_dir)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    """Context manager for database connections.
+
+    Connections are pooled, so repeated and nested blocks reuse one handle.
+    Work still uncommitted when the outermost block exits is rolled back,
+    just as closing a fresh connection would discard it.
+    """
+    pooled = _pooled_connection(project_dir)
+    pooled.depth += 1
     try:
-        yield conn
+        yield pooled.conn
     finally:
-        conn.close()
+        pooled.depth -= 1
+        if pooled.depth == 0 and pooled.conn.in_transaction:
+            pooled.conn.rollback()
+
+
+@contextmanager
+def _connection_scope(
+    project_dir: Optional[Path] = None,
+    conn: Optional[sqlite3.Connection] = None,
+) -> Generator[sqlite3.Connection, None, None]:
+    """Yield the caller's connection, or open one and commit on success.
+
+    When a connection is passed in, committing is left to the caller so
+    several writes can share a single transaction. The same applies when
+    the pooled connection is already in use by an enclosing block.
+    """
+    if conn is not None:
+        yield conn
+        return
+
+    pooled = _pooled_connection(project_dir)
+    with get_connection(project_dir) as new_conn:
+        yield new_conn
+        if pooled.depth == 1:
+            new_conn.commit()
+
+
+@contextmanager
+def db_session(project_dir: Optional[Path] = None) -> Generator[sqlite3.Connection, None, None]:
+    """Open one connection for a whole command and commit when it finishes.
+
+    Pass the yielded connection as ``conn=`` to the repository functions so
+    they share it instead of each opening their own.
+    """
+    with _connection_scope(project_dir) as conn:
+        yield conn
+
+
+# Table definitions, executed one statement at a time by init_schema
+_SCHEMA_STATEMENTS = (
+    # Core project info
+    """
+    CREATE TABLE IF NOT EXISTS projects (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        path TEXT UNIQUE NOT NULL,
+        name TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    # Installed agents
+    """
+    CREATE TABLE IF NOT EXISTS installed_agents (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        agent_name TEXT NOT NULL,
+        installed_at TEXT NOT NULL,
+        FOREIGN KEY (project_id) REFERENCES projects(id),
+        UNIQUE(project_id, agent_name)
+    )
+    """,
+    # Installed skills
+    """
+    CREATE TABLE IF NOT EXISTS installed_skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        skill_name TEXT NOT NULL,
+        installed_at TEXT NOT NULL,
+        FOREIGN KEY (project_id) REFERENCES projects(id),
+        UNIQUE(project_id, skill_name)
+    )
+    """,
+    # Schema version tracking
+    """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY
+    )
+    """,
+)
+
+
+def init_schema(conn: sqlite3.Connection) -> None:
+    """Create the tables and seed the schema version on an open connection.
+
+    Committing is left to the caller, so this also works on connections
+    that are not backed by a project's database file, and inside an
+    enclosing session without ending its transaction early.
+    """
+    # DDL does not implicitly open a transaction, so start one to create
+    # the tables and seed the version atomically
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    for statement in _SCHEMA_STATEMENTS:
+        conn.execute(statement)
+
+    # Set schema version if not exists
+    if conn.execute("SELECT version FROM schema_version LIMIT 1").fetchone() is None:
+        conn.execute(
+            "INSERT INTO schema_version (version) VALUES (?)",
+            (CURRENT_SCHEMA_VERSION,)
+        )
 
 
 def init_database(project_dir: Optional[Path] = None) -> Path:
     """Initialize the database with schema. Returns path to database file."""
     db_path = get_db_path(project_dir)
 
-    with get_connection(project_dir) as conn:
-        cursor = conn.cursor()
-
-        # Create tables
-        cursor.executescript("""
-            -- Core project info
-            CREATE TABLE IF NOT EXISTS projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                path TEXT UNIQUE NOT NULL,
-                name TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            );
-
-            -- Installed agents
-            CREATE TABLE IF NOT EXISTS installed_agents (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER NOT NULL,
-                agent_name TEXT NOT NULL,
-                installed_at TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects(id),
-                UNIQUE(project_id, agent_name)
-            );
-
-            -- Installed skills
-            CREATE TABLE IF NOT EXISTS installed_skills (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER NOT NULL,
-                skill_name TEXT NOT NULL,
-                installed_at TEXT NOT NULL,
-                FOREIGN KEY (project_id) REFERENCES projects(id),
-                UNIQUE(project_id, skill_name)
-            );
-
-            -- Schema version tracking
-            CREATE TABLE IF NOT EXISTS schema_version (
-                version INTEGER PRIMARY KEY
-            );
-        """)
-
-        # Set schema version if not exists
-        cursor.execute("SELECT version FROM schema_version LIMIT 1")
-        if cursor.fetchone() is None:
-            cursor.execute(
-                "INSERT INTO schema_version (version) VALUES (?)",
-                (CURRENT_SCHEMA_VERSION,)
-            )
-
-        conn.commit()
+    with _connection_scope(project_dir) as conn:
+        init_schema(conn)
 
     return db_path
 
@@ -108,14 +239,13 @@ def get_schema_version(project_dir: Optional[Path] = None) -> Optional[int]:
 
 def set_schema_version(version: int, project_dir: Optional[Path] = None) -> None:
     """Set the schema version."""
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir) as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM schema_version")
         cursor.execute(
             "INSERT INTO schema_version (version) VALUES (?)",
             (version,)
         )
-        conn.commit()
 
 
 # =============================================================================
@@ -125,12 +255,14 @@ def set_schema_version(version: int, project_dir: Optional[Path] = None) -> None
 def create_project(
     path: Path,
     name: Optional[str] = None,
-    project_dir: Optional[Path] = None
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
 ) -> int:
     """Create a new project record. Returns the project ID."""
     now = datetime.now().isoformat()
 
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir, conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -139,51 +271,87 @@ def create_project(
             """,
             (str(path), name, now, now)
         )
-        conn.commit()
         return cursor.lastrowid
 
 
-def get_project(project_dir: Optional[Path] = None) -> Optional[dict]:
+def get_project(
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> Optional[dict]:
     """Get the project record for the given directory."""
     if project_dir is None:
         project_dir = Path.cwd()
 
-    if not db_exists(project_dir):
+    # An open connection means the database exists; skip the extra stat
+    if conn is None and not db_exists(project_dir):
         return None
 
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir, conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
-            "SELECT * FROM projects WHERE path = ?",
+            "SELECT id, path, name, created_at, updated_at FROM projects WHERE path = ?",
             (str(project_dir),)
         )
         row = cursor.fetchone()
         return dict(row) if row else None
 
 
-def get_or_create_project(project_dir: Optional[Path] = None) -> int:
+def _get_project_id(conn: sqlite3.Connection, project_dir: Path) -> Optional[int]:
+    """Look up just the project ID, answered from the path index alone."""
+    row = conn.execute(
+        "SELECT id FROM projects WHERE path = ?",
+        (str(project_dir),)
+    ).fetchone()
+    return row["id"] if row else None
+
+
+def get_or_create_project(
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> int:
     """Get existing project or create new one. Returns project ID."""
     if project_dir is None:
         project_dir = Path.cwd()
 
-    project = get_project(project_dir)
-    if project:
-        return project["id"]
+    now = datetime.now().isoformat()
+
+    with _connection_scope(project_dir, conn) as conn:
+        project_id = _get_project_id(conn, project_dir)
+        if project_id is not None:
+            return project_id
 
-    return create_project(project_dir, name=project_dir.name, project_dir=project_dir)
+        # OR IGNORE + re-select keeps this safe if another process created
+        # the row in the meantime, instead of failing on UNIQUE(path)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            INSERT OR IGNORE INTO projects (path, name, created_at, updated_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (str(project_dir), project_dir.name, now, now)
+        )
+        if cursor.rowcount:
+            return cursor.lastrowid
+        return _get_project_id(conn, project_dir)
 
 
-def update_project_timestamp(project_id: int, project_dir: Optional[Path] = None) -> None:
+def update_project_timestamp(
+    project_id: int,
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> None:
     """Update the project's updated_at timestamp."""
     now = datetime.now().isoformat()
 
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir, conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE projects SET updated_at = ? WHERE id = ?",
             (now, project_id)
         )
-        conn.commit()
 
 
 # =============================================================================
@@ -193,58 +361,59 @@ def update_project_timestamp(project_id: int, project_dir: Optional[Path] = None
 def add_agent(
     project_id: int,
     agent_name: str,
-    project_dir: Optional[Path] = None
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
 ) -> None:
     """Add an agent to the project."""
-    now = datetime.now().isoformat()
-
-    with get_connection(project_dir) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO installed_agents (project_id, agent_name, installed_at)
-            VALUES (?, ?, ?)
-            """,
-            (project_id, agent_name, now)
-        )
-        conn.commit()
+    add_agents(project_id, [agent_name], project_dir, conn=conn)
 
 
-def get_agents(project_id: int, project_dir: Optional[Path] = None) -> List[str]:
+def get_agents(
+    project_id: int,
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> List[str]:
     """Get all agent names for a project."""
-    with get_connection(project_dir) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
+    with _connection_scope(project_dir, conn) as conn:
+        cursor = conn.execute(
             "SELECT agent_name FROM installed_agents WHERE project_id = ?",
             (project_id,)
         )
-        return [row["agent_name"] for row in cursor.fetchall()]
+        # Single-column rows: read by position straight off the cursor
+        return [row[0] for row in cursor]
 
 
 def remove_agent(
     project_id: int,
     agent_name: str,
-    project_dir: Optional[Path] = None
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
 ) -> None:
     """Remove an agent from the project."""
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir, conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "DELETE FROM installed_agents WHERE project_id = ? AND agent_name = ?",
             (project_id, agent_name)
         )
-        conn.commit()
 
 
-def clear_agents(project_id: int, project_dir: Optional[Path] = None) -> None:
+def clear_agents(
+    project_id: int,
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> None:
     """Remove all agents for a project."""
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir, conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "DELETE FROM installed_agents WHERE project_id = ?",
             (project_id,)
         )
-        conn.commit()
 
 
 # =============================================================================
@@ -254,81 +423,172 @@ def clear_agents(project_id: int, project_dir: Optional[Path] = None) -> None:
 def add_skill(
     project_id: int,
     skill_name: str,
-    project_dir: Optional[Path] = None
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
 ) -> None:
     """Add a skill to the project."""
-    now = datetime.now().isoformat()
-
-    with get_connection(project_dir) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO installed_skills (project_id, skill_name, installed_at)
-            VALUES (?, ?, ?)
-            """,
-            (project_id, skill_name, now)
-        )
-        conn.commit()
+    add_skills(project_id, [skill_name], project_dir, conn=conn)
 
 
-def get_skills(project_id: int, project_dir: Optional[Path] = None) -> List[str]:
+def get_skills(
+    project_id: int,
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> List[str]:
     """Get all skill names for a project."""
-    with get_connection(project_dir) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
+    with _connection_scope(project_dir, conn) as conn:
+        cursor = conn.execute(
             "SELECT skill_name FROM installed_skills WHERE project_id = ?",
             (project_id,)
         )
-        return [row["skill_name"] for row in cursor.fetchall()]
+        # Single-column rows: read by position straight off the cursor
+        return [row[0] for row in cursor]
 
 
 def remove_skill(
     project_id: int,
     skill_name: str,
-    project_dir: Optional[Path] = None
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
 ) -> None:
     """Remove a skill from the project."""
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir, conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "DELETE FROM installed_skills WHERE project_id = ? AND skill_name = ?",
             (project_id, skill_name)
         )
-        conn.commit()
 
 
-def clear_skills(project_id: int, project_dir: Optional[Path] = None) -> None:
+def clear_skills(
+    project_id: int,
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> None:
     """Remove all skills for a project."""
-    with get_connection(project_dir) as conn:
+    with _connection_scope(project_dir, conn) as conn:
         cursor = conn.cursor()
         cursor.execute(
             "DELETE FROM installed_skills WHERE project_id = ?",
             (project_id,)
         )
-        conn.commit()
+
+
+# =============================================================================
+# Installed Items
+# =============================================================================
+
+def get_installed(
+    project_id: int,
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> Tuple[List[str], List[str]]:
+    """Get installed agent and skill names for a project in one query."""
+    with _connection_scope(project_dir, conn) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT 'agent' AS kind, agent_name AS name
+            FROM installed_agents WHERE project_id = ?
+            UNION ALL
+            SELECT 'skill' AS kind, skill_name AS name
+            FROM installed_skills WHERE project_id = ?
+            """,
+            (project_id, project_id)
+        )
+        agents: List[str] = []
+        skills: List[str] = []
+        for kind, name in cursor:
+            (agents if kind == "agent" else skills).append(name)
+        return agents, skills
 
 
 # =============================================================================
 # Bulk Operations
 # =============================================================================
 
+def _bulk_add(
+    conn: sqlite3.Connection,
+    table: str,
+    name_column: str,
+    project_id: int,
+    names: Iterable[str],
+) -> None:
+    """Insert names into an installed_* table with a single executemany."""
+    now = datetime.now().isoformat()
+
+    conn.executemany(
+        f"""
+        INSERT OR IGNORE INTO {table} (project_id, {name_column}, installed_at)
+        VALUES (?, ?, ?)
+        """,
+        ((project_id, name, now) for name in names)
+    )
+
+
+def _bulk_replace(
+    conn: sqlite3.Connection,
+    table: str,
+    name_column: str,
+    project_id: int,
+    names: Iterable[str],
+) -> None:
+    """Replace a project's rows in an installed_* table in one batch."""
+    conn.execute(
+        f"DELETE FROM {table} WHERE project_id = ?",
+        (project_id,)
+    )
+    _bulk_add(conn, table, name_column, project_id, names)
+
+
+def add_agents(
+    project_id: int,
+    agent_names: Iterable[str],
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> None:
+    """Add several agents to the project, keeping any existing ones."""
+    with _connection_scope(project_dir, conn) as conn:
+        _bulk_add(conn, "installed_agents", "agent_name", project_id, agent_names)
+
+
+def add_skills(
+    project_id: int,
+    skill_names: Iterable[str],
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
+) -> None:
+    """Add several skills to the project, keeping any existing ones."""
+    with _connection_scope(project_dir, conn) as conn:
+        _bulk_add(conn, "installed_skills", "skill_name", project_id, skill_names)
+
+
 def set_agents(
     project_id: int,
     agent_names: List[str],
-    project_dir: Optional[Path] = None
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
 ) -> None:
     """Set the agents for a project, replacing any existing ones."""
-    clear_agents(project_id, project_dir)
-    for name in agent_names:
-        add_agent(project_id, name, project_dir)
+    with _connection_scope(project_dir, conn) as conn:
+        _bulk_replace(conn, "installed_agents", "agent_name", project_id, agent_names)
 
 
 def set_skills(
     project_id: int,
     skill_names: List[str],
-    project_dir: Optional[Path] = None
+    project_dir: Optional[Path] = None,
+    *,
+    conn: Optional[sqlite3.Connection] = None
 ) -> None:
     """Set the skills for a project, replacing any existing ones."""
-    clear_skills(project_id, project_dir)
-    for name in skill_names:
-        add_skill(project_id, name, project_dir)
+    with _connection_scope(project_dir, conn) as conn:
+        _bulk_replace(conn, "installed_skills", "skill_name", project_id, skill_names)
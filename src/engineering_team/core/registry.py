@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-import yaml
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .schema import AgentInfo, Registry, SkillCategory, SkillInfo
 
@@ -23,31 +24,220 @@ CATEGORY_DISPLAY_NAMES = {
 }
 
 
+# Frontmatter subset understood without PyYAML (see _parse_simple_yaml)
+_KEY_LINE = re.compile(r"([A-Za-z_][\w-]*):(?: +(.*))?$")
+_LIST_ITEM_LINE = re.compile(r"\s+- +(.+)$")
+# Plain scalars YAML would treat specially: indicators, comments, nested
+# mappings, and anything that could resolve to a bool/null/number/date
+_UNSAFE_PLAIN = re.compile(r"^[-?:,\[\]{}#&*!|>'\"%@`+=.\d]|: | #|:$|\t")
+# Flow list items kept to words, dots, slashes, dashes and spaces: PyYAML
+# ends or rejects flow plain scalars at indicators such as : ? [ ] { }
+_FLOW_ITEM = re.compile(r"[^\W\d][\w./ -]*$")
+_YAML_KEYWORDS = {"null", "~", "true", "false", "yes", "no", "on", "off", ".nan", ".inf"}
+
+
 def get_data_dir() -> Path:
     """Get the path to the bundled data directory."""
     return Path(__file__).parent.parent / "data"
 
 
+def _parse_scalar(value: str) -> Tuple[bool, Any]:
+    """Parse a plain or double-quoted scalar. Returns (ok, value)."""
+    value = value.rstrip()
+    if not value:
+        # An empty list item is null in YAML, not an empty string
+        return False, None
+    if value.startswith('"'):
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            return False, None
+        return isinstance(parsed, str), parsed
+
+    if _UNSAFE_PLAIN.search(value) or value.lower() in _YAML_KEYWORDS:
+        return False, None
+    return True, value
+
+
+def _parse_simple_yaml(text: str) -> Optional[Dict]:
+    """Parse the flat YAML subset used by agent and skill frontmatter.
+
+    Handles ``key: value`` pairs and lists written as ``[a, b]`` or as
+    indented ``- item`` lines. Returns None for anything else so the caller
+    can fall back to a real YAML parser.
+    """
+    result: Dict[str, Any] = {}
+    list_key = None
+    list_indent = 0
+
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        # YAML forbids tabs in indentation and is picky about them elsewhere
+        if "\t" in line:
+            return None
+
+        item = _LIST_ITEM_LINE.match(line)
+        if item:
+            if list_key is None:
+                return None
+            # A deeper or shallower dash continues or ends the list in YAML,
+            # so only items at the first item's indentation are handled here
+            indent = len(line) - len(line.lstrip())
+            if result[list_key] is None:
+                list_indent = indent
+            elif indent != list_indent:
+                return None
+            ok, value = _parse_scalar(item.group(1))
+            if not ok:
+                return None
+            if result[list_key] is None:
+                result[list_key] = []
+            result[list_key].append(value)
+            continue
+
+        match = _KEY_LINE.match(line)
+        if not match:
+            return None
+        key, raw = match.group(1), (match.group(2) or "").rstrip()
+        if key.lower() in _YAML_KEYWORDS:
+            # Keys like yes/on/null resolve to bool or None in YAML
+            return None
+        list_key = None
+
+        if not raw:
+            # Either an empty value or the start of a block list
+            result[key] = None
+            list_key = key
+        elif raw.startswith("[") and raw.endswith("]"):
+            inner = raw[1:-1].strip()
+            items = [part.strip() for part in inner.split(",")] if inner else []
+            parsed = []
+            # YAML drops one trailing comma but rejects other empty items
+            if items and not items[-1]:
+                items.pop()
+            for part in items:
+                if not _FLOW_ITEM.match(part):
+                    return None
+                ok, value = _parse_scalar(part)
+                if not ok:
+                    return None
+                parsed.append(value)
+            result[key] = parsed
+        else:
+            ok, value = _parse_scalar(raw)
+            if not ok:
+                return None
+            result[key] = value
+
+    return result
+
+
 def parse_frontmatter(content: str) -> Tuple[Dict, str]:
     """Parse YAML frontmatter from markdown content."""
     if not content.startswith("---"):
         return {}, content
 
     # Find the closing ---
-    end_match = re.search(r"\n---\n", content[3:])
-    if not end_match:
+    end = content.find("\n---\n", 3)
+    if end == -1:
         return {}, content
 
-    frontmatter_str = content[3 : end_match.start() + 3]
-    body = content[end_match.end() + 3 :]
+    frontmatter_str = content[3:end]
+    body = content[end + 5 :]
+
+    frontmatter = _parse_simple_yaml(frontmatter_str)
+    if frontmatter is not None:
+        return frontmatter, body
+
+    # PyYAML is only imported for frontmatter beyond the simple subset;
+    # prefer its libyaml-backed loader when available
+    import yaml
 
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        frontmatter = yaml.safe_load(frontmatter_str)
+        frontmatter = yaml.load(frontmatter_str, Loader=loader)
         return frontmatter or {}, body
     except yaml.YAMLError:
         return {}, content
 
 
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 file as bytes and decode once, skipping the text-IO layer.
+
+    Windows line endings are normalised so the frontmatter delimiters match.
+    """
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    return text
+
+
+@functools.lru_cache(maxsize=512)
+def _read_frontmatter_cached(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a file's frontmatter; the stat fields only serve as cache keys."""
+    frontmatter, _ = parse_frontmatter(_read_text(Path(path)))
+    return frontmatter
+
+
+def read_frontmatter(path: Path) -> Dict:
+    """Read a markdown file's frontmatter, reparsing only when the file changes.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    st = path.stat()
+    return _read_frontmatter_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_agent(md_file: Path) -> AgentInfo:
+    """Parse a single agent markdown file."""
+    frontmatter = read_frontmatter(md_file)
+
+    return AgentInfo(
+        # Use filename as name if not specified
+        name=frontmatter.get("name", md_file.stem),
+        description=frontmatter.get("description", "No description available"),
+        file_path=str(md_file),
+        tools=frontmatter.get("tools"),
+        model=frontmatter.get("model"),
+        skills=frontmatter.get("skills", []),
+    )
+
+
+def _list_names(path: Path) -> Set[str]:
+    """List the entry names in a directory with a single scandir."""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+def _sorted_subdirs(path: Path) -> List[os.DirEntry]:
+    """List a directory's subdirectories by name, using scandir's cached types."""
+    with os.scandir(path) as entries:
+        return sorted((entry for entry in entries if entry.is_dir()), key=lambda e: e.name)
+
+
+def load_skill(
+    skill_dir: Path, category: str, contents: Optional[Set[str]] = None
+) -> SkillInfo:
+    """Parse a single skill directory containing a SKILL.md file.
+
+    contents may carry the directory's entry names when the caller has
+    already listed it, saving another scan.
+    """
+    if contents is None:
+        contents = _list_names(skill_dir)
+    frontmatter = read_frontmatter(skill_dir / "SKILL.md")
+
+    return SkillInfo(
+        name=frontmatter.get("name", skill_dir.name),
+        description=frontmatter.get("description", "No description available"),
+        category=category,
+        dir_path=str(skill_dir),
+        has_references="references" in contents,
+        has_assets="assets" in contents,
+    )
+
+
 def discover_agents(data_dir: Optional[Path] = None) -> List[AgentInfo]:
     """Discover all available agents from the data directory."""
     if data_dir is None:
@@ -57,26 +247,7 @@ def discover_agents(data_dir: Optional[Path] = None) -> List[AgentInfo]:
     if not agents_dir.exists():
         return []
 
-    agents = []
-    for md_file in sorted(agents_dir.glob("*.md")):
-        content = md_file.read_text()
-        frontmatter, _ = parse_frontmatter(content)
-
-        if "name" not in frontmatter:
-            # Use filename as name if not specified
-            frontmatter["name"] = md_file.stem
-
-        agent = AgentInfo(
-            name=frontmatter.get("name", md_file.stem),
-            description=frontmatter.get("description", "No description available"),
-            file_path=str(md_file),
-            tools=frontmatter.get("tools"),
-            model=frontmatter.get("model"),
-            skills=frontmatter.get("skills", []),
-        )
-        agents.append(agent)
-
-    return agents
+    return [load_agent(md_file) for md_file in sorted(agents_dir.glob("*.md"))]
 
 
 def discover_skills(data_dir: Optional[Path] = None) -> List[SkillCategory]:
@@ -91,38 +262,23 @@ def discover_skills(data_dir: Optional[Path] = None) -> List[SkillCategory]:
     categories = []
 
     # Iterate through category directories
-    for category_dir in sorted(skills_dir.iterdir()):
-        if not category_dir.is_dir():
-            continue
-
+    for category_dir in _sorted_subdirs(skills_dir):
         category_name = category_dir.name
-        category = SkillCategory(
+        # Fields are built here, so skip revalidating them
+        category = SkillCategory.model_construct(
             name=category_name,
             display_name=CATEGORY_DISPLAY_NAMES.get(category_name, category_name.title()),
             skills=[],
         )
 
         # Find skills in this category
-        for skill_dir in sorted(category_dir.iterdir()):
-            if not skill_dir.is_dir():
+        for skill_dir in _sorted_subdirs(category_dir):
+            # One listing answers the SKILL.md, references/ and assets/ checks
+            contents = _list_names(skill_dir.path)
+            if "SKILL.md" not in contents:
                 continue
 
-            skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
-                continue
-
-            content = skill_md.read_text()
-            frontmatter, _ = parse_frontmatter(content)
-
-            skill = SkillInfo(
-                name=frontmatter.get("name", skill_dir.name),
-                description=frontmatter.get("description", "No description available"),
-                category=category_name,
-                dir_path=str(skill_dir),
-                has_references=(skill_dir / "references").exists(),
-                has_assets=(skill_dir / "assets").exists(),
-            )
-            category.skills.append(skill)
+            category.skills.append(load_skill(Path(skill_dir.path), category_name, contents))
 
         if category.skills:
             categories.append(category)
@@ -130,14 +286,49 @@ def discover_skills(data_dir: Optional[Path] = None) -> List[SkillCategory]:
     return categories
 
 
+@functools.cache
 def build_registry(data_dir: Optional[Path] = None) -> Registry:
-    """Build the complete registry of agents and skills."""
-    return Registry(
+    """Build the complete registry of agents and skills.
+
+    Cached per data directory: bundled package data does not change within
+    a process, so repeated calls return the same Registry. The agents and
+    categories are already validated models, so the Registry wrapper is
+    constructed without walking them again.
+    """
+    return Registry.model_construct(
         agents=discover_agents(data_dir),
         categories=discover_skills(data_dir),
     )
 
 
+def find_agent(name: str, data_dir: Optional[Path] = None) -> Optional[AgentInfo]:
+    """Look up one agent, reading only its own file when it is named after it.
+
+    Falls back to the full registry when the file is missing or its
+    frontmatter declares a different name.
+    """
+    agent_file = (data_dir or get_data_dir()) / "agents" / f"{name}.md"
+    if agent_file.is_file():
+        agent = load_agent(agent_file)
+        if agent.name == name:
+            return agent
+    return build_registry(data_dir).get_agent(name)
+
+
+def find_skill(name: str, data_dir: Optional[Path] = None) -> Optional[SkillInfo]:
+    """Look up one skill, reading only directories named after it.
+
+    Falls back to the full registry when no matching directory declares
+    that name.
+    """
+    skills_dir = (data_dir or get_data_dir()) / "skills"
+    for skill_md in sorted(skills_dir.glob(f"*/{name}/SKILL.md")):
+        skill = load_skill(skill_md.parent, skill_md.parent.parent.name)
+        if skill.name == name:
+            return skill
+    return build_registry(data_dir).get_skill(name)
+
+
 def resolve_skill_dependencies(
     registry: Registry, agent_names: List[str]
 ) -> Dict[str, List[str]]:
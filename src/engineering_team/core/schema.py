@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class AgentInfo(BaseModel):
@@ -43,20 +43,37 @@ class Registry(BaseModel):
     agents: List[AgentInfo] = Field(default_factory=list)
     categories: List[SkillCategory] = Field(default_factory=list)
 
+    # Name lookups (agents, skills), built on first use. Both dicts are
+    # published in one assignment so concurrent readers never see half
+    _indexes: Optional[Tuple[Dict[str, AgentInfo], Dict[str, SkillInfo]]] = PrivateAttr(
+        default=None
+    )
+
+    def _get_indexes(self) -> Tuple[Dict[str, AgentInfo], Dict[str, SkillInfo]]:
+        """Return the name indexes, keeping the first entry for duplicate names."""
+        indexes = self._indexes
+        if indexes is not None:
+            return indexes
+
+        agent_index: Dict[str, AgentInfo] = {}
+        for agent in self.agents:
+            agent_index.setdefault(agent.name, agent)
+
+        skill_index: Dict[str, SkillInfo] = {}
+        for category in self.categories:
+            for skill in category.skills:
+                skill_index.setdefault(skill.name, skill)
+
+        indexes = self._indexes = (agent_index, skill_index)
+        return indexes
+
     def get_agent(self, name: str) -> Optional[AgentInfo]:
         """Get an agent by name."""
-        for agent in self.agents:
-            if agent.name == name:
-                return agent
-        return None
+        return self._get_indexes()[0].get(name)
 
     def get_skill(self, name: str) -> Optional[SkillInfo]:
         """Get a skill by name."""
-        for category in self.categories:
-            for skill in category.skills:
-                if skill.name == name:
-                    return skill
-        return None
+        return self._get_indexes()[1].get(name)
 
     def get_all_skills(self) -> List[SkillInfo]:
         """Get all skills across all categories."""
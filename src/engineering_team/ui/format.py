@@ -0,0 +1,8 @@
+"""Text formatting helpers for engineering-team output."""
+
+
+def truncate(text: str, width: int) -> str:
+    """Shorten text to at most width characters, ending in an ellipsis if cut."""
+    if len(text) <= width:
+        return text
+    return f"{text[:width - 3]}..."
@@ -8,6 +8,7 @@ import questionary
 from questionary import Choice, Separator, Style
 
 from ..core.schema import AgentInfo, Registry
+from .format import truncate
 
 
 # Custom style for prompts
@@ -25,6 +26,18 @@ CUSTOM_STYLE = Style(
 )
 
 
+# Display tags for skill categories in the flat skill list
+_CATEGORY_TAGS = {
+    "languages": "[Languages]",
+    "frameworks": "[Frameworks]",
+    "databases": "[Databases]",
+    "design": "[Design]",
+    "cloud": "[Cloud]",
+    "product": "[Product]",
+    "test-tools": "[Test Tools]",
+}
+
+
 def confirm_reconfigure() -> bool:
     """Ask user if they want to reconfigure existing installation."""
     return questionary.confirm(
@@ -52,6 +65,14 @@ def _group_agents(agents: List[AgentInfo]) -> Dict[str, List[AgentInfo]]:
     return groups
 
 
+def _agent_label(agent: AgentInfo) -> str:
+    """Format an agent's checkbox title with its skill dependency hint."""
+    label = f"{agent.name:<28} {truncate(agent.description, 50)}"
+    if agent.skills:
+        label += f"   needs: {', '.join(agent.skills)}"
+    return label
+
+
 def select_agents(
     agents: List[AgentInfo], preselected: Optional[List[str]] = None
 ) -> List[str]:
@@ -59,6 +80,7 @@ def select_agents(
     if not agents:
         return []
 
+    preselected_set = set(preselected or [])
     groups = _group_agents(agents)
     choices: list = []
 
@@ -66,20 +88,14 @@ def select_agents(
         if not group_agents:
             continue
         choices.append(Separator(f"── {group_name} ──"))
-        for agent in group_agents:
-            desc = agent.description
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
-            label = f"{agent.name:<28} {desc}"
-            if agent.skills:
-                label += f"   needs: {', '.join(agent.skills)}"
-            choices.append(
-                Choice(
-                    title=label,
-                    value=agent.name,
-                    checked=preselected and agent.name in preselected,
-                )
+        choices.extend(
+            Choice(
+                title=_agent_label(agent),
+                value=agent.name,
+                checked=agent.name in preselected_set,
             )
+            for agent in group_agents
+        )
 
     selected = questionary.checkbox(
         "Select agents to install:",
@@ -104,41 +120,26 @@ def select_skills_flat(
     preselected_set = set(preselected or [])
     required_names = set(required_map.keys())
 
-    # Split into required vs additional
-    required_skills = [s for s in all_skills if s.name in required_names]
-    additional_skills = [s for s in all_skills if s.name not in required_names]
+    # Sort into required vs additional in a single pass
+    required_choices: list = []
+    additional_choices: list = []
+    for skill in all_skills:
+        desc = truncate(skill.description, 45)
+        title = f"{skill.name:<24} {desc}   {_category_tag(skill.category)}"
+        if skill.name in required_names:
+            required_choices.append(Choice(title=title, value=skill.name, checked=True))
+        else:
+            additional_choices.append(
+                Choice(title=title, value=skill.name, checked=skill.name in preselected_set)
+            )
 
     choices: list = []
-
-    if required_skills:
+    if required_choices:
         choices.append(Separator("── Required by selected agents ──"))
-        for skill in required_skills:
-            desc = skill.description
-            if len(desc) > 45:
-                desc = desc[:42] + "..."
-            category_tag = _category_tag(skill.category)
-            choices.append(
-                Choice(
-                    title=f"{skill.name:<24} {desc}   {category_tag}",
-                    value=skill.name,
-                    checked=True,
-                )
-            )
-
-    if additional_skills:
+        choices.extend(required_choices)
+    if additional_choices:
         choices.append(Separator("── Additional skills ──"))
-        for skill in additional_skills:
-            desc = skill.description
-            if len(desc) > 45:
-                desc = desc[:42] + "..."
-            category_tag = _category_tag(skill.category)
-            choices.append(
-                Choice(
-                    title=f"{skill.name:<24} {desc}   {category_tag}",
-                    value=skill.name,
-                    checked=skill.name in preselected_set and skill.name not in required_names,
-                )
-            )
+        choices.extend(additional_choices)
 
     selected = questionary.checkbox(
         "Select additional skills:",
@@ -152,13 +153,4 @@ def select_skills_flat(
 
 def _category_tag(category: str) -> str:
     """Return a display tag for a skill category."""
-    tags = {
-        "languages": "[Languages]",
-        "frameworks": "[Frameworks]",
-        "databases": "[Databases]",
-        "design": "[Design]",
-        "cloud": "[Cloud]",
-        "product": "[Product]",
-        "test-tools": "[Test Tools]",
-    }
-    return tags.get(category, f"[{category.title()}]")
+    return _CATEGORY_TAGS.get(category) or f"[{category.title()}]"
@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from engineering_team.core.database import close_connections
+
+
+@pytest.fixture(autouse=True)
+def _close_pooled_connections():
+    """Drop pooled connections after each test so none outlive its temp dir.
+
+    The pool is per process, so this also keeps each pytest-xdist worker
+    from carrying connections between the tests it runs.
+    """
+    yield
+    close_connections()
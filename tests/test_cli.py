@@ -0,0 +1,39 @@
+"""Tests for the CLI entry point."""
+
+import pytest
+from typer.testing import CliRunner
+
+from engineering_team.cli import COMMANDS, app
+
+
+runner = CliRunner()
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--help", "init"], ["--help", "--version"]])
+def test_help_lists_every_command(args):
+    """Test top-level help shows all subcommands however it is reached."""
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    for name in COMMANDS:
+        assert name in result.output
+
+
+def test_subcommand_help():
+    """Test a subcommand loads on demand and renders its own help."""
+    result = runner.invoke(app, ["init", "--help"])
+    assert result.exit_code == 0
+    assert "--force" in result.output
+
+
+def test_version():
+    """Test --version prints the version without needing a subcommand."""
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert "engineering-team version" in result.output
+
+
+def test_unknown_command_suggests_match():
+    """Test typo suggestions still see the lazily loaded commands."""
+    result = runner.invoke(app, ["lst"])
+    assert result.exit_code != 0
+    assert "list" in result.output
@@ -0,0 +1,94 @@
+"""Tests for the copier module."""
+
+import shutil
+import stat
+from pathlib import Path
+
+import pytest
+
+from engineering_team.core.copier import copy_agent, copy_skill
+from engineering_team.core.schema import AgentInfo, SkillInfo
+
+
+@pytest.fixture
+def skill(tmp_path: Path) -> SkillInfo:
+    """Create a skill with references in a fake data directory."""
+    skill_dir = tmp_path / "data" / "my-skill"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text("# My skill\n")
+    (skill_dir / "references" / "guide.md").write_text("Guide\n")
+    (skill_dir / "notes.txt").write_text("Not part of the skill\n")
+    return SkillInfo(
+        name="my-skill",
+        description="A test skill",
+        category="languages",
+        dir_path=str(skill_dir),
+        has_references=True,
+    )
+
+
+class TestCopyAgent:
+    """Tests for copying agent files."""
+
+    def test_copies_agent_with_mtime(self, tmp_path: Path):
+        """Test the agent file is copied and keeps its modification time."""
+        src = tmp_path / "my-agent.md"
+        src.write_text("# My agent\n")
+        agent = AgentInfo(name="my-agent", description="A test agent", file_path=str(src))
+
+        dest = copy_agent(agent, tmp_path / "project")
+
+        assert dest == tmp_path / "project" / ".claude" / "agents" / "my-agent.md"
+        assert dest.read_text() == "# My agent\n"
+        assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+class TestCopySkill:
+    """Tests for copying skill directories."""
+
+    def test_copies_skill_files(self, tmp_path: Path, skill: SkillInfo):
+        """Test SKILL.md and references are copied, other files are not."""
+        project_dir = tmp_path / "project"
+        dest = copy_skill(skill, project_dir)
+
+        assert dest == project_dir / ".claude" / "skills" / "my-skill"
+        assert (dest / "SKILL.md").read_text() == "# My skill\n"
+        assert (dest / "references" / "guide.md").read_text() == "Guide\n"
+        assert not (dest / "notes.txt").exists()
+
+    def test_unchanged_files_are_not_recopied(
+        self, tmp_path: Path, skill: SkillInfo, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a second copy leaves up-to-date files alone."""
+        project_dir = tmp_path / "project"
+        copy_skill(skill, project_dir)
+
+        copied = []
+        monkeypatch.setattr(shutil, "copyfile", lambda src, dst: copied.append(src))
+        copy_skill(skill, project_dir)
+        assert copied == []
+
+    def test_changed_and_stale_files_are_synced(self, tmp_path: Path, skill: SkillInfo):
+        """Test local edits are overwritten and stale files removed."""
+        project_dir = tmp_path / "project"
+        dest = copy_skill(skill, project_dir)
+        (dest / "SKILL.md").write_text("edited locally\n")
+        (dest / "references" / "old.md").write_text("Stale\n")
+
+        copy_skill(skill, project_dir)
+        assert (dest / "SKILL.md").read_text() == "# My skill\n"
+        assert not (dest / "references" / "old.md").exists()
+
+    def test_permission_bits_are_copied_and_repaired(self, tmp_path: Path, skill: SkillInfo):
+        """Test executable files keep +x, and a later sync restores lost bits."""
+        script = Path(skill.dir_path) / "references" / "run.sh"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+
+        project_dir = tmp_path / "project"
+        dest = copy_skill(skill, project_dir) / "references" / "run.sh"
+        assert stat.S_IMODE(dest.stat().st_mode) == 0o755
+
+        dest.chmod(0o644)
+        copy_skill(skill, project_dir)
+        assert stat.S_IMODE(dest.stat().st_mode) == 0o755
@@ -1,6 +1,8 @@
 """Tests for the database module."""
 
-import tempfile
+import os
+import shutil
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -8,18 +10,25 @@ import pytest
 from engineering_team.core.database import (
     CURRENT_SCHEMA_VERSION,
     add_agent,
+    add_agents,
     add_skill,
+    add_skills,
     clear_agents,
     clear_skills,
+    close_connections,
     create_project,
     db_exists,
+    db_session,
     get_agents,
+    get_connection,
     get_db_path,
+    get_installed,
     get_or_create_project,
     get_project,
     get_schema_version,
     get_skills,
     init_database,
+    init_schema,
     remove_agent,
     remove_skill,
     set_agents,
@@ -29,96 +38,146 @@ from engineering_team.core.database import (
 )
 
 
+# Project path recorded by the in-memory tests; nothing is written there
+PROJECT_DIR = Path("/project")
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory) -> Path:
+    """Create one initialized database file to copy into each test."""
+    template_dir = tmp_path_factory.mktemp("template")
+    db_path = init_database(template_dir)
+    # Closing checkpoints the WAL so the file alone holds the schema
+    close_connections()
+    return db_path
+
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def db_dir(tmp_path: Path, template_db: Path):
+    """Create a temporary directory holding an already initialized database."""
+    shutil.copyfile(template_db, get_db_path(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def mem_conn():
+    """Create an in-memory database with the schema, for repository tests."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    init_schema(conn)
+    conn.commit()
+    yield conn
+    conn.close()
 
 
 class TestDatabaseConnection:
     """Tests for database connection and initialization."""
 
-    def test_get_db_path(self, temp_dir: Path):
+    def test_get_db_path(self, tmp_path: Path):
         """Test getting the database path."""
-        path = get_db_path(temp_dir)
-        assert path == temp_dir / "engineering-team.db"
+        path = get_db_path(tmp_path)
+        assert path == tmp_path / "engineering-team.db"
 
-    def test_db_exists_false(self, temp_dir: Path):
+    def test_db_exists_false(self, tmp_path: Path):
         """Test db_exists returns False when no database."""
-        assert db_exists(temp_dir) is False
+        assert db_exists(tmp_path) is False
 
-    def test_init_database(self, temp_dir: Path):
+    def test_init_database(self, tmp_path: Path):
         """Test database initialization."""
-        db_path = init_database(temp_dir)
+        db_path = init_database(tmp_path)
         assert db_path.exists()
-        assert db_exists(temp_dir) is True
-
-    def test_schema_version(self, temp_dir: Path):
+        assert db_exists(tmp_path) is True
+
+    def test_connection_pragmas(self, tmp_path: Path):
+        """Test connections use WAL with relaxed syncing."""
+        init_database(tmp_path)
+        with get_connection(tmp_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # 1 == NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_wal_enabled(self, tmp_path: Path):
+        """Test WAL is persisted in the database file, not just the pooled handle."""
+        db_path = init_database(tmp_path)
+        raw = sqlite3.connect(db_path)
+        try:
+            assert raw.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            raw.close()
+
+    def test_pool_not_shared_across_processes(self, tmp_path: Path, monkeypatch):
+        """Test a forked process opens its own connection instead of the parent's."""
+        init_database(tmp_path)
+        with get_connection(tmp_path) as parent_conn:
+            pass
+        # The "child" drops the pool without closing it, so close it here
+        parent_conn.close()
+
+        monkeypatch.setattr(os, "getpid", lambda: -1)
+        with get_connection(tmp_path) as child_conn:
+            assert child_conn is not parent_conn
+        # Close while the fake pid still owns the pool
+        close_connections()
+        with pytest.raises(sqlite3.ProgrammingError):
+            child_conn.execute("SELECT 1")
+
+    def test_schema_version(self, tmp_path: Path):
         """Test schema version tracking."""
         # Before init, version should be None
-        assert get_schema_version(temp_dir) is None
+        assert get_schema_version(tmp_path) is None
 
         # After init, version should be current
-        init_database(temp_dir)
-        assert get_schema_version(temp_dir) == CURRENT_SCHEMA_VERSION
+        init_database(tmp_path)
+        assert get_schema_version(tmp_path) == CURRENT_SCHEMA_VERSION
 
         # Can update version
-        set_schema_version(2, temp_dir)
-        assert get_schema_version(temp_dir) == 2
+        set_schema_version(2, tmp_path)
+        assert get_schema_version(tmp_path) == 2
 
 
 class TestProjectRepository:
     """Tests for project CRUD operations."""
 
-    def test_create_and_get_project(self, temp_dir: Path):
+    def test_create_and_get_project(self, db_dir: Path):
         """Test creating and retrieving a project."""
-        init_database(temp_dir)
-
-        project_id = create_project(temp_dir, name="test-project", project_dir=temp_dir)
+        project_id = create_project(db_dir, name="test-project", project_dir=db_dir)
         assert project_id is not None
         assert project_id > 0
 
-        project = get_project(temp_dir)
+        project = get_project(db_dir)
         assert project is not None
-        assert project["path"] == str(temp_dir)
+        assert project["path"] == str(db_dir)
         assert project["name"] == "test-project"
         assert project["created_at"] is not None
         assert project["updated_at"] is not None
 
-    def test_get_project_not_found(self, temp_dir: Path):
+    def test_get_project_not_found(self, db_dir: Path):
         """Test getting a project that doesn't exist."""
-        init_database(temp_dir)
-        project = get_project(temp_dir)
+        project = get_project(db_dir)
         assert project is None
 
-    def test_get_or_create_project_creates(self, temp_dir: Path):
+    def test_get_or_create_project_creates(self, db_dir: Path):
         """Test get_or_create creates new project."""
-        init_database(temp_dir)
-
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(db_dir)
         assert project_id is not None
         assert project_id > 0
 
-        project = get_project(temp_dir)
+        project = get_project(db_dir)
         assert project is not None
 
-    def test_get_or_create_project_gets_existing(self, temp_dir: Path):
+    def test_get_or_create_project_gets_existing(self, db_dir: Path):
         """Test get_or_create returns existing project."""
-        init_database(temp_dir)
-
-        project_id1 = get_or_create_project(temp_dir)
-        project_id2 = get_or_create_project(temp_dir)
+        project_id1 = get_or_create_project(db_dir)
+        project_id2 = get_or_create_project(db_dir)
         assert project_id1 == project_id2
 
-    def test_update_project_timestamp(self, temp_dir: Path):
+    def test_update_project_timestamp(self, db_dir: Path):
         """Test updating project timestamp."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(db_dir)
 
-        project_before = get_project(temp_dir)
-        update_project_timestamp(project_id, temp_dir)
-        project_after = get_project(temp_dir)
+        project_before = get_project(db_dir)
+        update_project_timestamp(project_id, db_dir)
+        project_after = get_project(db_dir)
 
         # Timestamps should be different (or at least not earlier)
         assert project_after["updated_at"] >= project_before["updated_at"]
@@ -127,142 +186,251 @@ class TestProjectRepository:
 class TestAgentRepository:
     """Tests for agent CRUD operations."""
 
-    def test_add_and_get_agents(self, temp_dir: Path):
+    def test_add_and_get_agents(self, mem_conn: sqlite3.Connection):
         """Test adding and retrieving agents."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_agent(project_id, "backend-architect", temp_dir)
-        add_agent(project_id, "code-reviewer", temp_dir)
+        add_agent(project_id, "backend-architect", conn=mem_conn)
+        add_agent(project_id, "code-reviewer", conn=mem_conn)
 
-        agents = get_agents(project_id, temp_dir)
+        agents = get_agents(project_id, conn=mem_conn)
         assert len(agents) == 2
         assert "backend-architect" in agents
         assert "code-reviewer" in agents
 
-    def test_remove_agent(self, temp_dir: Path):
+    def test_remove_agent(self, mem_conn: sqlite3.Connection):
         """Test removing an agent."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_agent(project_id, "backend-architect", temp_dir)
-        add_agent(project_id, "code-reviewer", temp_dir)
+        add_agent(project_id, "backend-architect", conn=mem_conn)
+        add_agent(project_id, "code-reviewer", conn=mem_conn)
 
-        remove_agent(project_id, "backend-architect", temp_dir)
+        remove_agent(project_id, "backend-architect", conn=mem_conn)
 
-        agents = get_agents(project_id, temp_dir)
+        agents = get_agents(project_id, conn=mem_conn)
         assert len(agents) == 1
         assert "code-reviewer" in agents
 
-    def test_clear_agents(self, temp_dir: Path):
+    def test_clear_agents(self, mem_conn: sqlite3.Connection):
         """Test clearing all agents."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_agent(project_id, "backend-architect", temp_dir)
-        add_agent(project_id, "code-reviewer", temp_dir)
+        add_agent(project_id, "backend-architect", conn=mem_conn)
+        add_agent(project_id, "code-reviewer", conn=mem_conn)
 
-        clear_agents(project_id, temp_dir)
+        clear_agents(project_id, conn=mem_conn)
 
-        agents = get_agents(project_id, temp_dir)
+        agents = get_agents(project_id, conn=mem_conn)
         assert len(agents) == 0
 
-    def test_set_agents(self, temp_dir: Path):
+    def test_set_agents(self, mem_conn: sqlite3.Connection):
         """Test replacing all agents."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
         # Add initial agent
-        add_agent(project_id, "backend-architect", temp_dir)
+        add_agent(project_id, "backend-architect", conn=mem_conn)
 
         # Replace with new agents
-        set_agents(project_id, ["frontend-dev", "devops"], temp_dir)
+        set_agents(project_id, ["frontend-dev", "devops"], conn=mem_conn)
 
-        agents = get_agents(project_id, temp_dir)
+        agents = get_agents(project_id, conn=mem_conn)
         assert len(agents) == 2
         assert "frontend-dev" in agents
         assert "devops" in agents
         assert "backend-architect" not in agents
 
-    def test_add_agent_idempotent(self, temp_dir: Path):
+    def test_add_agent_idempotent(self, mem_conn: sqlite3.Connection):
         """Test adding same agent twice doesn't duplicate."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_agent(project_id, "backend-architect", temp_dir)
-        add_agent(project_id, "backend-architect", temp_dir)
+        add_agent(project_id, "backend-architect", conn=mem_conn)
+        add_agent(project_id, "backend-architect", conn=mem_conn)
 
-        agents = get_agents(project_id, temp_dir)
+        agents = get_agents(project_id, conn=mem_conn)
         assert len(agents) == 1
 
+    def test_add_agents_keeps_existing(self, mem_conn: sqlite3.Connection):
+        """Test bulk adding agents from an iterator."""
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
+
+        add_agent(project_id, "backend-architect", conn=mem_conn)
+        add_agents(project_id, iter(["code-reviewer", "devops"]), conn=mem_conn)
+
+        agents = get_agents(project_id, conn=mem_conn)
+        assert sorted(agents) == ["backend-architect", "code-reviewer", "devops"]
+
+    def test_readd_keeps_install_time(self, mem_conn: sqlite3.Connection):
+        """Test adding an installed agent again leaves its row untouched."""
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
+        query = "SELECT id, installed_at FROM installed_agents WHERE agent_name = ?"
+
+        add_agent(project_id, "backend-architect", conn=mem_conn)
+        before = tuple(mem_conn.execute(query, ("backend-architect",)).fetchone())
+        add_agent(project_id, "backend-architect", conn=mem_conn)
+        after = tuple(mem_conn.execute(query, ("backend-architect",)).fetchone())
+
+        assert after == before
+
 
 class TestSkillRepository:
     """Tests for skill CRUD operations."""
 
-    def test_add_and_get_skills(self, temp_dir: Path):
+    def test_add_and_get_skills(self, mem_conn: sqlite3.Connection):
         """Test adding and retrieving skills."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_skill(project_id, "typescript", temp_dir)
-        add_skill(project_id, "flutter", temp_dir)
+        add_skill(project_id, "typescript", conn=mem_conn)
+        add_skill(project_id, "flutter", conn=mem_conn)
 
-        skills = get_skills(project_id, temp_dir)
+        skills = get_skills(project_id, conn=mem_conn)
         assert len(skills) == 2
         assert "typescript" in skills
         assert "flutter" in skills
 
-    def test_remove_skill(self, temp_dir: Path):
+    def test_remove_skill(self, mem_conn: sqlite3.Connection):
         """Test removing a skill."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_skill(project_id, "typescript", temp_dir)
-        add_skill(project_id, "flutter", temp_dir)
+        add_skill(project_id, "typescript", conn=mem_conn)
+        add_skill(project_id, "flutter", conn=mem_conn)
 
-        remove_skill(project_id, "typescript", temp_dir)
+        remove_skill(project_id, "typescript", conn=mem_conn)
 
-        skills = get_skills(project_id, temp_dir)
+        skills = get_skills(project_id, conn=mem_conn)
         assert len(skills) == 1
         assert "flutter" in skills
 
-    def test_clear_skills(self, temp_dir: Path):
+    def test_clear_skills(self, mem_conn: sqlite3.Connection):
         """Test clearing all skills."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_skill(project_id, "typescript", temp_dir)
-        add_skill(project_id, "flutter", temp_dir)
+        add_skill(project_id, "typescript", conn=mem_conn)
+        add_skill(project_id, "flutter", conn=mem_conn)
 
-        clear_skills(project_id, temp_dir)
+        clear_skills(project_id, conn=mem_conn)
 
-        skills = get_skills(project_id, temp_dir)
+        skills = get_skills(project_id, conn=mem_conn)
         assert len(skills) == 0
 
-    def test_set_skills(self, temp_dir: Path):
+    def test_set_skills(self, mem_conn: sqlite3.Connection):
         """Test replacing all skills."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
         # Add initial skill
-        add_skill(project_id, "typescript", temp_dir)
+        add_skill(project_id, "typescript", conn=mem_conn)
 
         # Replace with new skills
-        set_skills(project_id, ["python", "rust"], temp_dir)
+        set_skills(project_id, ["python", "rust"], conn=mem_conn)
 
-        skills = get_skills(project_id, temp_dir)
+        skills = get_skills(project_id, conn=mem_conn)
         assert len(skills) == 2
         assert "python" in skills
         assert "rust" in skills
         assert "typescript" not in skills
 
-    def test_add_skill_idempotent(self, temp_dir: Path):
+    def test_add_skill_idempotent(self, mem_conn: sqlite3.Connection):
         """Test adding same skill twice doesn't duplicate."""
-        init_database(temp_dir)
-        project_id = get_or_create_project(temp_dir)
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
 
-        add_skill(project_id, "typescript", temp_dir)
-        add_skill(project_id, "typescript", temp_dir)
+        add_skill(project_id, "typescript", conn=mem_conn)
+        add_skill(project_id, "typescript", conn=mem_conn)
 
-        skills = get_skills(project_id, temp_dir)
+        skills = get_skills(project_id, conn=mem_conn)
         assert len(skills) == 1
+
+    def test_add_skills_keeps_existing(self, mem_conn: sqlite3.Connection):
+        """Test bulk adding skills from an iterator."""
+        project_id = get_or_create_project(PROJECT_DIR, conn=mem_conn)
+
+        add_skill(project_id, "typescript", conn=mem_conn)
+        add_skills(project_id, iter(["python", "rust"]), conn=mem_conn)
+
+        skills = get_skills(project_id, conn=mem_conn)
+        assert sorted(skills) == ["python", "rust", "typescript"]
+
+
+class TestInstalledItems:
+    """Tests for reading installed agents and skills together."""
+
+    def test_get_installed(self, db_dir: Path):
+        """Test agents and skills come back split by kind."""
+        project_id = get_or_create_project(db_dir)
+
+        set_agents(project_id, ["backend-architect", "code-reviewer"], db_dir)
+        set_skills(project_id, ["python"], db_dir)
+
+        agents, skills = get_installed(project_id, db_dir)
+        assert sorted(agents) == ["backend-architect", "code-reviewer"]
+        assert skills == ["python"]
+
+    def test_get_installed_empty(self, db_dir: Path):
+        """Test a project with nothing installed."""
+        project_id = get_or_create_project(db_dir)
+
+        assert get_installed(project_id, db_dir) == ([], [])
+
+
+class TestSharedConnection:
+    """Tests for batching writes on a caller-provided connection."""
+
+    def test_writes_share_one_transaction(self, db_dir: Path):
+        """Test writes on a shared connection commit together."""
+        project_id = get_or_create_project(db_dir)
+
+        with get_connection(db_dir) as conn:
+            set_agents(project_id, ["backend-architect"], db_dir, conn=conn)
+            set_skills(project_id, ["python"], db_dir, conn=conn)
+            update_project_timestamp(project_id, db_dir, conn=conn)
+
+            # Nothing is visible to other connections until the caller commits
+            other = sqlite3.connect(get_db_path(db_dir))
+            assert other.execute("SELECT * FROM installed_agents").fetchall() == []
+            conn.commit()
+            assert len(other.execute("SELECT * FROM installed_agents").fetchall()) == 1
+            other.close()
+
+        assert get_agents(project_id, db_dir) == ["backend-architect"]
+        assert get_skills(project_id, db_dir) == ["python"]
+
+    def test_db_session_commits_on_exit(self, db_dir: Path):
+        """Test a session commits everything written through it."""
+        with db_session(db_dir) as conn:
+            project_id = get_or_create_project(db_dir, conn=conn)
+            set_agents(project_id, ["code-reviewer"], db_dir, conn=conn)
+
+        assert get_project(db_dir)["id"] == project_id
+        assert get_agents(project_id, db_dir) == ["code-reviewer"]
+
+    @pytest.mark.parametrize(
+        "nested_call",
+        [
+            lambda project_dir: set_schema_version(CURRENT_SCHEMA_VERSION, project_dir),
+            init_database,
+        ],
+        ids=["set_schema_version", "init_database"],
+    )
+    def test_schema_writes_do_not_commit_session(self, db_dir: Path, nested_call):
+        """Test schema helpers inside a session leave its rollback intact."""
+        project_id = get_or_create_project(db_dir)
+
+        with pytest.raises(RuntimeError):
+            with db_session(db_dir) as conn:
+                set_agents(project_id, ["code-reviewer"], db_dir, conn=conn)
+                nested_call(db_dir)
+                raise RuntimeError("abort")
+
+        assert get_agents(project_id, db_dir) == []
+
+    def test_nested_scopes_leave_commit_to_outer_block(self, db_dir: Path):
+        """Test calls without conn inside a session don't commit it early."""
+        project_id = get_or_create_project(db_dir)
+
+        with get_connection(db_dir) as conn:
+            set_agents(project_id, ["code-reviewer"], db_dir, conn=conn)
+            # Uses the pooled connection, so it sees the pending write...
+            assert get_agents(project_id, db_dir) == ["code-reviewer"]
+            # ...and leaves the transaction open for the caller
+            assert conn.in_transaction
+
+        # Never committed, so it is rolled back when the block exits
+        assert get_agents(project_id, db_dir) == []
@@ -0,0 +1,159 @@
+"""Tests for the registry module."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import yaml
+
+from engineering_team.core.registry import (
+    _parse_simple_yaml,
+    build_registry,
+    find_agent,
+    find_skill,
+    get_data_dir,
+    parse_frontmatter,
+    read_frontmatter,
+)
+from engineering_team.core.schema import AgentInfo, Registry, SkillCategory, SkillInfo
+
+
+class TestBuildRegistry:
+    """Tests for registry construction."""
+
+    def test_discovers_bundled_data(self):
+        """Test the bundled agents and skills are discovered."""
+        registry = build_registry()
+        assert registry.get_agent("code-reviewer") is not None
+        assert registry.get_skill("python") is not None
+
+    def test_registry_is_cached(self):
+        """Test repeated builds return the same registry."""
+        assert build_registry() is build_registry()
+
+
+class TestRegistryLookup:
+    """Tests for Registry name lookups."""
+
+    def test_duplicate_names_return_first(self):
+        """Test the first agent wins when two share a name."""
+        first = AgentInfo(name="dup", description="first", file_path="a.md")
+        second = AgentInfo(name="dup", description="second", file_path="b.md")
+        registry = Registry(agents=[first, second])
+
+        assert registry.get_agent("dup") is first
+        assert registry.get_agent("missing") is None
+
+    def test_concurrent_first_lookups(self):
+        """Test agent and skill lookups racing to build the indexes both succeed."""
+        agent = AgentInfo(name="agent", description="An agent", file_path="a.md")
+        skill = SkillInfo(name="skill", description="A skill", category="cloud", dir_path="s")
+        category = SkillCategory(name="cloud", display_name="Cloud", skills=[skill])
+
+        for _ in range(50):
+            registry = Registry(agents=[agent], categories=[category])
+            barrier = threading.Barrier(2)
+
+            def lookup(get):
+                barrier.wait()
+                return get()
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                found_agent = executor.submit(lookup, lambda: registry.get_agent("agent"))
+                found_skill = executor.submit(lookup, lambda: registry.get_skill("skill"))
+                assert found_agent.result() is agent
+                assert found_skill.result() is skill
+
+
+class TestFindItems:
+    """Tests for single agent/skill lookups."""
+
+    def test_find_agent(self):
+        """Test a single agent matches its registry entry."""
+        assert find_agent("code-reviewer") == build_registry().get_agent("code-reviewer")
+
+    def test_find_skill(self):
+        """Test a single skill matches its registry entry."""
+        assert find_skill("mermaid") == build_registry().get_skill("mermaid")
+
+    def test_find_missing(self):
+        """Test unknown names return None."""
+        assert find_agent("no-such-agent") is None
+        assert find_skill("no-such-skill") is None
+
+
+class TestReadFrontmatter:
+    """Tests for cached frontmatter reads."""
+
+    def test_reparses_changed_file(self, tmp_path: Path):
+        """Test edits to a file are picked up on the next read."""
+        md_file = tmp_path / "agent.md"
+        md_file.write_text("---\nname: first\n---\nBody\n")
+        assert read_frontmatter(md_file) == {"name": "first"}
+
+        md_file.write_text("---\nname: second-name\n---\nBody\n")
+        assert read_frontmatter(md_file) == {"name": "second-name"}
+
+    def test_windows_line_endings(self, tmp_path: Path):
+        """Test CRLF files still have their frontmatter found."""
+        md_file = tmp_path / "agent.md"
+        md_file.write_bytes(b"---\r\nname: crlf\r\n---\r\nBody\r\n")
+        assert read_frontmatter(md_file) == {"name": "crlf"}
+
+
+class TestParseFrontmatter:
+    """Tests for the frontmatter parser."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "name: my-agent\ntools: Read, Write\nskills:\n  - python\n  - flutter",
+            "name: my-agent\nskills: []",
+            "name: my-agent\nskills: [python, mermaid]",
+            'description: "Quoted: with \\"escapes\\""',
+            # Outside the simple subset, handled by PyYAML
+            "name: my-agent\nversion: 2\nenabled: true",
+            "name: 'single quoted'\nmeta:\n  nested: value",
+            "description: >\n  folded\n  text",
+            "name: my-agent\nskills: [python, mermaid,]",
+            "name: my-agent\nskills:\n  - python\n    - mermaid",
+            "yes: 1x\non: a",
+            "true: a\nnull: b",
+            "name: my-agent\nskills:\n  -  ",
+            "skills: [a=b, docs/api, state-mgmt]",
+            "skills: [python:3, [nested]]",
+        ],
+    )
+    def test_matches_pyyaml(self, text: str):
+        """Test parsed frontmatter is identical to PyYAML's result."""
+        frontmatter, body = parse_frontmatter(f"---\n{text}\n---\nBody\n")
+        assert frontmatter == yaml.safe_load(text)
+        assert body == "Body\n"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "skills: [,]",
+            "skills: [python, , mermaid]",
+            "skills:\n\t- python",
+            "name: my-agent\t\nmodel: sonnet",
+            "skills: [a?1]",
+            "name: =",
+        ],
+    )
+    def test_invalid_yaml_falls_back(self, text: str):
+        """Test input PyYAML rejects is left to it rather than parsed."""
+        with pytest.raises(yaml.YAMLError):
+            yaml.safe_load(text)
+        assert _parse_simple_yaml(text) is None
+
+    def test_bundled_files_match_pyyaml(self):
+        """Test every bundled agent and skill parses as PyYAML would."""
+        for md_file in get_data_dir().rglob("*.md"):
+            content = md_file.read_text()
+            if not content.startswith("---\n"):
+                continue
+            frontmatter, _ = parse_frontmatter(content)
+            raw = content[4 : content.index("\n---\n", 3)]
+            assert frontmatter == (yaml.safe_load(raw) or {}), md_file